@@ -24,6 +24,28 @@ from hats_import.pipeline_resume_plan import get_pixel_cache_directory, print_ta
 # pylint: disable=too-many-locals,too-many-arguments
 
 
+class _RowCountAggregator(HistogramAggregator):
+    """Aggregator for the row counts of a single input file.
+
+    Per-pixel row counts within one file fit comfortably in 32 bits, so the dense
+    array is kept as int32 to halve its footprint at high mapping orders. If the
+    file's total row count ever exceeds the int32 range, the array is widened to int64.
+    Partial histograms are combined as int64 when read by the resume plan.
+    """
+
+    def __init__(self, order):
+        super().__init__(order)
+        self.full_histogram = np.zeros_like(self.full_histogram, dtype=np.int32)
+        self.total_rows = 0
+
+    def add(self, other):
+        if other is not None:
+            self.total_rows += int(np.sum(other.counts))
+            if self.full_histogram.dtype == np.int32 and self.total_rows > np.iinfo(np.int32).max:
+                self.full_histogram = self.full_histogram.astype(np.int64)
+        super().add(other)
+
+
 def _has_named_index(dataframe):
     """Heuristic to determine if a dataframe has some meaningful index.
 
@@ -164,7 +186,7 @@ def map_to_pixels(
         FileNotFoundError: if the file does not exist, or is a directory
     """
     try:
-        row_count_histo = HistogramAggregator(highest_order)
+        row_count_histo = _RowCountAggregator(highest_order)
         mem_size_histo = HistogramAggregator(highest_order)
 
         # Determine which columns to read from the input file. If we're using
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pickle
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
 import hats.pixel_math.healpix_shim as hp
@@ -232,9 +233,11 @@ class ResumePlan(PipelineResumePlan):
                 raise RuntimeError(f"{len(remaining_map_files)} map stages did not complete successfully.")
             histogram_files = import_io.find_files_matching_path(self.tmp_path, histogram_directory, "*.npz")
             aggregate_histogram = HistogramAggregator(healpix_order)
-            for partial_file_name in histogram_files:
-                partial = SparseHistogram.from_file(partial_file_name)
-                aggregate_histogram.add(partial)
+            # Partial files are small, so reading is dominated by per-file latency.
+            # Read ahead in a few threads while earlier partials are being added.
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                for partial in executor.map(SparseHistogram.from_file, histogram_files):
+                    aggregate_histogram.add(partial)
 
             file_name = import_io.append_paths_to_pointer(self.tmp_path, histogram_binary_file)
             with file_name.open("wb+") as file_handle:
@@ -290,9 +293,7 @@ class ResumePlan(PipelineResumePlan):
         Returns:
             list of splitting keys *not* found in files like /resume/path/split_key.done
         """
-        prefix = file_io.get_upath(self.tmp_path) / self.SPLITTING_STAGE
-        split_file_pattern = re.compile(r"split_(\d+)_done")
-        done_indexes = [int(split_file_pattern.match(path.name).group(1)) for path in prefix.glob("*_done")]
+        done_indexes = [int(key[len("split_") :]) for key in self.read_done_keys(self.SPLITTING_STAGE)]
         remaining_indexes = list(set(range(0, len(self.input_paths))) - set(done_indexes))
         return [(f"split_{key}", self.input_paths[key]) for key in remaining_indexes]
 
@@ -395,7 +396,7 @@ class ResumePlan(PipelineResumePlan):
 
             # Write alignment to file.
             with file_name.open("wb") as pickle_file:
-                alignment = np.array([x if x is not None else [-1, -1, 0] for x in alignment], dtype=np.int64)
+                alignment = self._fill_empty_alignment(alignment)
                 pickle.dump(alignment, pickle_file)
 
         # Check that the destination pixel map (alignment file) matches expected total rows.
@@ -431,15 +432,34 @@ class ResumePlan(PipelineResumePlan):
             np.array: alignment array where each entry is [order, pixel, row_count] or
                 [order, pixel, row_count, mem_size] depending on threshold_mode.
         """
-        alignment = np.full((len(raw_histogram_row_count), 3), [-1, -1, 0])
-        for pixel_num, pixel_row_count_sum in enumerate(raw_histogram_row_count):
-            alignment[pixel_num] = [
-                constant_healpix_order,
-                pixel_num,
-                pixel_row_count_sum,
-            ]
+        alignment = np.empty((len(raw_histogram_row_count), 3), dtype=np.int64)
+        alignment[:, 0] = constant_healpix_order
+        alignment[:, 1] = np.arange(len(raw_histogram_row_count))
+        alignment[:, 2] = raw_histogram_row_count
         return alignment
 
+    @staticmethod
+    def _fill_empty_alignment(alignment):
+        """Convert an alignment into a dense integer array, with unmapped pixels as [-1, -1, 0].
+
+        Args:
+            alignment (:obj:`np.array`): alignment from ``hats.pixel_math``, where each entry is
+                either an (order, pixel, row_count) tuple or None, or an already-dense integer array.
+
+        Returns:
+            np.array: (N, 3) array of int64 [order, pixel, row_count].
+        """
+        alignment = np.asarray(alignment)
+        if alignment.dtype != object or alignment.ndim == 2:
+            ## Every pixel is mapped, so there are no empty entries to fill.
+            return alignment.astype(np.int64, copy=False)
+        dense_alignment = np.empty((len(alignment), 3), dtype=np.int64)
+        dense_alignment[:] = [-1, -1, 0]
+        mapped_index = np.flatnonzero(np.not_equal(alignment, None))
+        if len(mapped_index) > 0:
+            dense_alignment[mapped_index] = alignment[mapped_index].tolist()
+        return dense_alignment
+
     def wait_for_splitting(self, futures):
         """Wait for splitting futures to complete."""
         self.wait_for_futures(futures, self.SPLITTING_STAGE)
@@ -460,13 +480,14 @@ class ResumePlan(PipelineResumePlan):
         if self.destination_pixel_map is None:
             raise RuntimeError("destination pixel map not provided for progress tracking.")
 
-        reduced_pixels = self.read_done_pixels(self.REDUCING_STAGE)
+        ## Compare on reduce key strings, rather than building and hashing a HealpixPixel per done file.
+        reduced_keys = set(self.read_done_keys(self.REDUCING_STAGE))
 
-        remaining_pixels = list(set(self.destination_pixel_map.keys()) - set(reduced_pixels))
-        return [
-            (hp_pixel, self.destination_pixel_map[hp_pixel], f"{hp_pixel.order}_{hp_pixel.pixel}")
-            for hp_pixel in remaining_pixels
+        reduce_items = [
+            (hp_pixel, num_rows, f"{hp_pixel.order}_{hp_pixel.pixel}")
+            for hp_pixel, num_rows in self.destination_pixel_map.items()
         ]
+        return [reduce_item for reduce_item in reduce_items if reduce_item[2] not in reduced_keys]
 
     def get_destination_pixels(self):
         """Create HealpixPixel list of all destination pixels."""
@@ -19,7 +19,6 @@ def generate_margin_cache(args, client):
         client (dask.distributed.Client): A dask distributed client object.
     """
     resume_plan = MarginCachePlan(args)
-    original_catalog_metadata = paths.get_common_metadata_pointer(args.input_catalog_path)
 
     if not resume_plan.is_mapping_done():
         futures = []
@@ -33,7 +32,7 @@ def generate_margin_cache(args, client):
                     partition_file=partition_file,
                     source_pixel=pix,
                     mapping_key=mapping_key,
-                    original_catalog_metadata=original_catalog_metadata,
+                    schema=args.catalog.schema,
                     margin_pair_file=resume_plan.margin_pair_file,
                     output_path=args.tmp_path,
                     margin_order=args.margin_order,
@@ -15,44 +15,55 @@ def map_pixel_shards(
     partition_file,
     source_pixel,
     mapping_key,
-    original_catalog_metadata,
+    schema,
     margin_pair_file,
     output_path,
     margin_order,
     healpix_column,
     healpix_order,
 ):
-    """Creates margin cache shards from a source partition file."""
+    """Creates margin cache shards from a source partition file.
+
+    The original catalog's arrow ``schema`` is read once by the caller and passed in,
+    rather than re-read by each mapping task."""
     try:
-        schema = file_io.read_parquet_metadata(original_catalog_metadata).schema.to_arrow_schema()
+        # Constrain the possible margin pairs to only those `margin_order` pixels
+        # that **can** be contained in source pixel.
+        explosion_factor = 4 ** int(margin_order - source_pixel.order)
+        margin_pixel_range_start = source_pixel.pixel * explosion_factor
+        margin_pixel_range_end = (source_pixel.pixel + 1) * explosion_factor
+        margin_pair_file = file_io.get_upath(margin_pair_file)
+        margin_pairs = pq.read_table(
+            margin_pair_file.path,
+            filesystem=margin_pair_file.fs,
+            filters=(ds.field("margin_pixel") >= margin_pixel_range_start)
+            & (ds.field("margin_pixel") < margin_pixel_range_end),
+        ).to_pandas()
+
+        # If no destination partition has a margin inside this source pixel, we don't
+        # need to read any of the source data.
+        if len(margin_pairs) == 0:
+            MarginCachePlan.mapping_key_done(output_path, mapping_key, 0)
+            return
 
-        # first pass to compute margin filter
+        # First pass to compute margin filter: constrain margin pairs further, by
+        # `margin_order` pixels for rows in source data.
         data = pq.read_table(
             partition_file.path, filesystem=partition_file.fs, schema=schema, columns=[healpix_column]
         ).combine_chunks()
 
-        # Constrain the possible margin pairs, first by only those `margin_order` pixels
-        # that **can** be contained in source pixel, then by `margin_order` pixels for rows
-        # in source data
-        margin_pairs = pd.read_csv(margin_pair_file)
-        explosion_factor = 4 ** int(margin_order - source_pixel.order)
-        margin_pixel_range_start = source_pixel.pixel * explosion_factor
-        margin_pixel_range_end = (source_pixel.pixel + 1) * explosion_factor
-        margin_pairs = margin_pairs.query(
-            f"margin_pixel >= {margin_pixel_range_start} and margin_pixel < {margin_pixel_range_end}"
-        )
-
         margin_pixel_list = spatial_index_to_healpix(
             data[healpix_column].to_numpy(),
             target_order=margin_order,
             spatial_index_order=healpix_order,
         )
-        margin_pixel_filter = pd.DataFrame(
-            {"margin_pixel": margin_pixel_list, "filter_value": np.arange(0, len(margin_pixel_list))}
-        ).merge(margin_pairs, on="margin_pixel")
+
+        # For every possible output pixel, find the rows whose `margin_order` pixel
+        # is in that pixel's margin.
+        partition_row_filters = _partition_row_filters(margin_pixel_list, margin_pairs)
 
         # If no row falls into any margin pixel, skip the full-schema read entirely.
-        if len(margin_pixel_filter) == 0:
+        if len(partition_row_filters) == 0:
             MarginCachePlan.mapping_key_done(output_path, mapping_key, 0)
             return
 
@@ -61,13 +72,11 @@ def map_pixel_shards(
             partition_file.path, filesystem=partition_file.fs, schema=schema
         ).combine_chunks()
 
-        # For every possible output pixel, find the full margin_order pixel filter list,
-        # perform the filter, and pass along to helper method to compute fine filter
-        # and write out shard file.
+        # Perform the filter for each output pixel, and pass along to helper method
+        # to compute fine filter and write out shard file.
         num_rows = 0
-        for partition_key, data_filter in margin_pixel_filter.groupby(["partition_order", "partition_pixel"]):
-            data_filter = np.unique(data_filter["filter_value"])
-            filtered_data = data.take(data_filter)
+        for partition_key, row_filter in partition_row_filters.items():
+            filtered_data = data.take(row_filter)
             pixel = HealpixPixel(partition_key[0], partition_key[1])
 
             num_rows += _to_pixel_shard(
@@ -84,6 +93,62 @@ def map_pixel_shards(
         raise exception
 
 
+def _partition_row_filters(margin_pixel_list, margin_pairs):
+    """Join each row's `margin_order` pixel against the margin pairs, in one vectorized pass.
+
+    Args:
+        margin_pixel_list (np.ndarray): the `margin_order` pixel of every row in the source data.
+        margin_pairs (pd.DataFrame): margin pairs, with `margin_pixel`, `partition_order`,
+            and `partition_pixel` columns.
+
+    Returns:
+        dict mapping each ``(partition_order, partition_pixel)`` to the sorted, unique
+        indexes of the rows that fall into that partition's margin. Partitions with
+        no matching rows are omitted.
+    """
+    margin_pairs = margin_pairs.drop_duplicates().sort_values("margin_pixel", kind="stable")
+    pair_margin_pixels = margin_pairs["margin_pixel"].to_numpy()
+    unique_margin_pixels, run_starts, run_counts = np.unique(
+        pair_margin_pixels, return_index=True, return_counts=True
+    )
+
+    ## Look up each row's margin pixel in the (small) set of paired margin pixels. A matched
+    ## row pairs with the contiguous run of sorted pairs for that margin pixel.
+    run_index = pd.Index(unique_margin_pixels).get_indexer(margin_pixel_list)
+    matched_rows = np.flatnonzero(run_index >= 0)
+    if len(matched_rows) == 0:
+        return {}
+    run_index = run_index[matched_rows]
+    match_count = run_counts[run_index]
+    total_matches = int(match_count.sum())
+
+    row_index = np.repeat(matched_rows, match_count)
+    offset_in_run = np.arange(total_matches) - np.repeat(np.cumsum(match_count) - match_count, match_count)
+    pair_index = np.repeat(run_starts[run_index], match_count) + offset_in_run
+    partition_orders = margin_pairs["partition_order"].to_numpy()[pair_index]
+    partition_pixels = margin_pairs["partition_pixel"].to_numpy()[pair_index]
+
+    ## Group matches by destination partition. Rows are already ascending within a partition,
+    ## and pairs are unique, so each partition's row indexes are sorted and unique.
+    match_sort = np.lexsort((partition_pixels, partition_orders))
+    row_index = row_index[match_sort]
+    partition_orders = partition_orders[match_sort]
+    partition_pixels = partition_pixels[match_sort]
+    partition_starts = np.flatnonzero(
+        np.concatenate(
+            [
+                [True],
+                (partition_orders[1:] != partition_orders[:-1])
+                | (partition_pixels[1:] != partition_pixels[:-1]),
+            ]
+        )
+    )
+    return {
+        (int(partition_orders[start]), int(partition_pixels[start])): row_filter
+        for start, row_filter in zip(partition_starts, np.split(row_index, partition_starts[1:]))
+    }
+
+
 # pylint: disable=too-many-arguments, unused-argument
 def _to_pixel_shard(
     filtered_data,
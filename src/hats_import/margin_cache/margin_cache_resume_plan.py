@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+import numpy as np
 import pandas as pd
 from hats import pixel_math
 from hats.io import file_io
@@ -24,7 +25,8 @@ class MarginCachePlan(PipelineResumePlan):
 
     MAPPING_STAGE = "mapping"
     REDUCING_STAGE = "reducing"
-    MARGIN_PAIR_FILE = "margin_pair.csv"
+    MARGIN_PAIR_FILE = "margin_pair.parquet"
+    MARGIN_PAIR_ROW_GROUP_SIZE = 65_536
     MAPPING_TOTAL_FILE = "mapping_total"
 
     def __init__(self, args: MarginCacheArguments):
@@ -47,10 +49,21 @@ class MarginCachePlan(PipelineResumePlan):
             self.partition_pixels = args.catalog.partition_info.get_healpix_pixels()
             negative_pixels = args.catalog.generate_negative_tree_pixels()
             self.combined_pixels = self.partition_pixels + negative_pixels
+            self._partition_keys = [
+                (f"{pixel.order}_{pixel.pixel}", pixel) for pixel in self.partition_pixels
+            ]
+            self._combined_keys = [(f"{pixel.order}_{pixel.pixel}", pixel) for pixel in self.combined_pixels]
             self.margin_pair_file = import_io.append_paths_to_pointer(self.tmp_path, self.MARGIN_PAIR_FILE)
             if not self.margin_pair_file.exists():
                 margin_pairs = _find_partition_margin_pixel_pairs(self.combined_pixels, args.margin_order)
-                margin_pairs.to_csv(self.margin_pair_file, index=False)
+                ## Pairs are sorted by margin pixel, so bounded row groups let each mapping
+                ## task skip those outside its source pixel's margin pixel range.
+                margin_pairs.to_parquet(
+                    self.margin_pair_file.path,
+                    filesystem=self.margin_pair_file.fs,
+                    index=False,
+                    row_group_size=self.MARGIN_PAIR_ROW_GROUP_SIZE,
+                )
             step_progress.update(1)
 
             file_io.make_directory(
@@ -106,9 +119,8 @@ class MarginCachePlan(PipelineResumePlan):
 
     def get_remaining_map_keys(self):
         """Fetch a tuple for each pixel/partition left to map."""
-        mapped_pixels = set(self.read_done_pixels(self.MAPPING_STAGE))
-        remaining_pixels = list(set(self.partition_pixels) - set(mapped_pixels))
-        return [(f"{hp_pixel.order}_{hp_pixel.pixel}", hp_pixel) for hp_pixel in remaining_pixels]
+        mapped_keys = set(self.read_done_keys(self.MAPPING_STAGE))
+        return [key_pair for key_pair in self._partition_keys if key_pair[0] not in mapped_keys]
 
     @classmethod
     def reducing_key_done(cls, tmp_path, reducing_key: str):
@@ -122,9 +134,8 @@ class MarginCachePlan(PipelineResumePlan):
 
     def get_remaining_reduce_keys(self):
         """Fetch a tuple for each object catalog pixel to reduce."""
-        reduced_pixels = self.read_done_pixels(self.REDUCING_STAGE)
-        remaining_pixels = list(set(self.combined_pixels) - set(reduced_pixels))
-        return [(f"{hp_pixel.order}_{hp_pixel.pixel}", hp_pixel) for hp_pixel in remaining_pixels]
+        reduced_keys = set(self.read_done_keys(self.REDUCING_STAGE))
+        return [key_pair for key_pair in self._combined_keys if key_pair[0] not in reduced_keys]
 
     def is_reducing_done(self) -> bool:
         """Are there partitions left to reduce?"""
@@ -151,26 +162,18 @@ def _find_partition_margin_pixel_pairs(combined_pixels, margin_order):
         margin_order (int): the order of healpixels that will be used to constrain
             the margin data before doing more precise boundary checking.
     """
-    norders = []
-    part_pix = []
-    margin_pix = []
+    margins = [
+        pixel_math.get_margin(healpixel.order, healpixel.pixel, margin_order - healpixel.order)
+        for healpixel in combined_pixels
+    ]
+    margin_counts = [len(pixel_margins) for pixel_margins in margins]
 
-    for healpixel in combined_pixels:
-        order = healpixel.order
-        pix = healpixel.pixel
-
-        d_order = margin_order - order
-
-        margins = pixel_math.get_margin(order, pix, d_order)
-
-        for m_p in margins:
-            norders.append(order)
-            part_pix.append(pix)
-            margin_pix.append(m_p)
+    norders = np.repeat([healpixel.order for healpixel in combined_pixels], margin_counts)
+    part_pix = np.repeat([healpixel.pixel for healpixel in combined_pixels], margin_counts)
+    margin_pix = np.concatenate(margins) if margins else np.array([], dtype=np.int64)
 
     margin_pairs_df = pd.DataFrame(
-        zip(norders, part_pix, margin_pix),
-        columns=["partition_order", "partition_pixel", "margin_pixel"],
+        {"partition_order": norders, "partition_pixel": part_pix, "margin_pixel": margin_pix}
     ).sort_values("margin_pixel")
     return margin_pairs_df
 
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-import re
+import functools
+import hashlib
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
 from dask.distributed import as_completed, get_worker
 from dask.distributed import print as dask_print
+from dask.distributed import wait
 from hats.io import file_io
 from hats.pixel_math.healpix_pixel import HealpixPixel
-from tqdm.auto import tqdm as auto_tqdm
-from tqdm.std import tqdm as std_tqdm
 from upath import UPath
 
 import hats_import.file_io as import_io
@@ -49,6 +50,7 @@ class PipelineResumePlan:
     generated by the pipeline?"""
 
     ORIGINAL_INPUT_PATHS = "input_paths.txt"
+    ORIGINAL_INPUT_PATHS_DIGEST = "input_paths.blake2b"
 
     def safe_to_resume(self):
         """Check that we are ok to resume an in-progress pipeline, if one exists.
@@ -122,16 +124,42 @@ class PipelineResumePlan:
             list[str] - all keys found in done directory
         """
         prefix = import_io.append_paths_to_pointer(self.tmp_path, stage_name)
-        result = {}
-        result_files = import_io.find_files_matching_path(prefix, "*_done")
-        done_file_pattern = re.compile(r"(.*)_done")
-        for file_path in result_files:
-            match = done_file_pattern.match(str(file_path.name))
-            if not match:
-                raise ValueError(f"Unexpected file found: {file_path.name}")
-            key = match.group(1)
-            result[key] = file_io.load_text_file(file_path)
-        return result
+        return {
+            key: file_io.load_text_file(prefix / f"{key}_done")
+            for key in sorted(self.read_done_keys(stage_name))
+        }
+
+    def read_done_keys(self, stage_name: str) -> list[str]:
+        """Inspect the stage's directory of done files, fetching the keys from done file names.
+
+        Args:
+            stage_name(str): name of the stage (e.g. mapping, reducing)
+        Return:
+            list[str] - all keys found in done directory
+        """
+        prefix = import_io.append_paths_to_pointer(self.tmp_path, stage_name)
+        if not prefix.exists():
+            return []
+        return self.get_keys_from_file_names(prefix, "_done")
+
+    @staticmethod
+    def get_keys_from_file_names(directory, extension: str) -> list[str]:
+        """Gather keys for successful tasks from result file names.
+
+        Args:
+            directory: where to look for result files. this is NOT a recursive lookup
+            extension (str): file suffix to look for and to remove from all file names.
+                if you expect a file like "map_01.csv", extension should be ".csv"
+        Return:
+            list[str] - all file names in the directory ending in the extension, with
+            the extension removed
+        """
+        suffix_length = len(extension)
+        if directory.protocol in ("", "file", "local"):
+            ## Local directories can use names straight from the directory listing.
+            with os.scandir(directory.path) as entries:
+                return [entry.name[:-suffix_length] for entry in entries if entry.name.endswith(extension)]
+        return [path.name[:-suffix_length] for path in directory.iterdir() if path.name.endswith(extension)]
 
     def read_done_pixels(self, stage_name):
         """Inspect the stage's directory of done files, fetching the pixel keys from done file names.
@@ -141,10 +169,8 @@ class PipelineResumePlan:
         Return:
             List[HealpixPixel] - all pixel keys found in done directory
         """
-        prefix = import_io.append_paths_to_pointer(self.tmp_path, stage_name)
-        done_file_pattern = re.compile(r"(\d+)_(\d+)_done")
-        pixel_tuples = [done_file_pattern.match(path.name).group(1, 2) for path in prefix.glob("*_done")]
-        return [HealpixPixel(int(match[0]), int(match[1])) for match in pixel_tuples]
+        pixel_tuples = [key.split("_") for key in self.read_done_keys(stage_name)]
+        return [HealpixPixel(int(order), int(pixel)) for order, pixel in pixel_tuples]
 
     def clean_resume_files(self):
         """Remove the intermediate directory created in execution if the user decided
@@ -154,11 +180,13 @@ class PipelineResumePlan:
             # delete the intermediate directory from inside the output directory
             path = self.tmp_base_path if self.tmp_base_path is not None else self.tmp_path
             file_io.remove_directory(path, ignore_errors=True)
+        get_pixel_cache_directory.cache_clear()
 
     def wait_for_futures(self, futures, stage_name, fail_fast=False):
         """Wait for collected futures to complete.
 
-        As each future completes, check the returned status.
+        As each future completes, check the returned status. If we're not displaying
+        progress, and not failing fast, we wait for all futures together instead.
 
         Args:
             futures(List[future]): collected futures
@@ -170,11 +198,18 @@ class PipelineResumePlan:
             RuntimeError: if any future returns an error status.
         """
         some_error = False
-        for future in self.print_progress(as_completed(futures), stage_name=stage_name, total=len(futures)):
-            if future.status == "error":
-                some_error = True
-                if fail_fast:
-                    raise future.exception()
+        if fail_fast or self.progress_bar:
+            for future in self.print_progress(
+                as_completed(futures), stage_name=stage_name, total=len(futures)
+            ):
+                if future.status == "error":
+                    some_error = True
+                    if fail_fast:
+                        raise future.exception()
+        else:
+            ## Nothing to report as futures complete, so wait for all of them at once.
+            wait(futures)
+            some_error = any(future.status == "error" for future in futures)
 
         if some_error:
             raise RuntimeError(f"Some {stage_name} stages failed. See above Exceptions.")
@@ -206,6 +241,11 @@ class PipelineResumePlan:
         """Validate that we're operating on the same file set as the original pipeline,
         or save the inputs as the originals if not found.
 
+        A blake2b digest of the sorted input paths is also saved. On resume, a matching
+        digest confirms the file set without reading the full ``input_paths.txt``. Note
+        that this fast path still stringifies, sorts, and joins every input path to
+        compute the digest; it only skips reading and parsing the text file.
+
         Args:
             input_paths (list[str]): input paths that will be processed by a pipeline.
 
@@ -214,9 +254,18 @@ class PipelineResumePlan:
         """
         if not input_paths:
             return []
-        expected_input_paths = set(input_paths)
         expected_input_paths = [str(p) for p in input_paths]
         expected_input_paths.sort()
+        expected_digest = hashlib.blake2b("\n".join(expected_input_paths).encode("utf-8")).hexdigest()
+
+        ## Fast path: the digest of the original file set is enough to confirm a match.
+        digest_file_path = import_io.append_paths_to_pointer(self.tmp_path, self.ORIGINAL_INPUT_PATHS_DIGEST)
+        try:
+            with open(digest_file_path, "r", encoding="utf-8") as file_handle:
+                if file_handle.read().strip() == expected_digest:
+                    return input_paths
+        except FileNotFoundError:
+            pass
 
         original_input_paths = []
 
@@ -234,13 +283,16 @@ class PipelineResumePlan:
             with open(log_file_path, "w", encoding="utf-8") as file_handle:
                 for path in input_paths:
                     file_handle.write(f"{path}\n")
-        else:
-            if original_input_paths != expected_input_paths:
-                raise ValueError("Different file set from resumed pipeline execution.")
+        elif original_input_paths != expected_input_paths:
+            raise ValueError("Different file set from resumed pipeline execution.")
+
+        with open(digest_file_path, "w", encoding="utf-8") as file_handle:
+            file_handle.write(expected_digest)
 
         return input_paths
 
 
+@functools.lru_cache(maxsize=100_000)
 def get_pixel_cache_directory(cache_path, pixel: HealpixPixel):
     """Create a path for intermediate pixel data.
 
@@ -250,6 +302,9 @@ def get_pixel_cache_directory(cache_path, pixel: HealpixPixel):
 
         {cache_path}/order_{order}/dir_{dir}/pixel_{pixel}/
 
+    The same directories are requested for every shard written and every pixel
+    reduced, so results are memoized per ``(cache_path, pixel)``.
+
     Args:
         cache_path (str): root path to cache
         pixel (HealpixPixel): pixel partition data
@@ -317,20 +372,32 @@ def print_progress(
             in a particular notebook where ipywidgets cannot be used
             (only used when ``use_progress_bar`` is True)
     """
+    # pylint: disable=import-outside-toplevel
+    if not use_progress_bar:
+        if iterable is not None:
+            return iterable
+        ## Callers may still use the result as a context manager, and call ``update``.
+        from tqdm.std import tqdm as std_tqdm
+
+        return std_tqdm(total=total, disable=True)
+
     tqdm_kwargs = tqdm_kwargs or {}
     if simple_progress_bar:
+        from tqdm.std import tqdm as std_tqdm
+
         return std_tqdm(
             iterable,
             desc=get_formatted_stage_name(stage_name, pipeline_name),
             total=total,
-            disable=not use_progress_bar,
             **tqdm_kwargs,
         )
 
+    ## tqdm.auto pulls in notebook/widget detection, so only import it when displaying.
+    from tqdm.auto import tqdm as auto_tqdm
+
     return auto_tqdm(
         iterable,
         desc=get_formatted_stage_name(stage_name, pipeline_name),
         total=total,
-        disable=not use_progress_bar,
         **tqdm_kwargs,
     )
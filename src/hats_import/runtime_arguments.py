@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numbers
 import re
 from dataclasses import dataclass
 from importlib.metadata import version
@@ -228,9 +229,12 @@ def check_healpix_order_range(
         lower_bound (int): lower bound of range
         upper_bound (int): upper bound of range
     Raise:
+        TypeError: if the order is not an integer.
         ValueError: if the order is outside the specified range, or bounds
             are unreasonable.
     """
+    if not isinstance(order, numbers.Integral):
+        raise TypeError(f"{field_name} of type {type(order).__name__} not supported. Must be an integer.")
     if lower_bound < 0:
         raise ValueError("healpix orders must be positive")
     if upper_bound > spatial_index.SPATIAL_INDEX_ORDER:
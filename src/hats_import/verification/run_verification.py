@@ -2,18 +2,19 @@
 
 import datetime
 import re
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from functools import cached_property
 from time import perf_counter
 from urllib.parse import unquote
 
 import hats
 import hats.io.paths
 import hats.io.validation
-import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pyarrow.dataset as pds
 from hats.pixel_math.spatial_index import SPATIAL_INDEX_COLUMN
+from pyarrow import csv as pa_csv
 
 import hats_import
 from hats_import.verification.arguments import VerificationArguments
@@ -146,15 +147,33 @@ class Verifier:
             constructed_truth_schema=constructed_truth_schema,
         )
 
+    @cached_property
+    def files_ds_relative_paths(self) -> frozenset[str]:
+        """Relative paths of the parquet data files found on disk."""
+        return frozenset(self._relative_paths(self.files_ds.files))
+
+    @cached_property
+    def metadata_ds_relative_paths(self) -> frozenset[str]:
+        """Relative paths of the parquet data files listed in the _metadata file."""
+        return frozenset(self._relative_paths(self.metadata_ds.files))
+
     @property
     def results_df(self) -> pd.DataFrame:
         """Test results as a dataframe."""
         return pd.DataFrame(self.results)
 
     @property
-    def all_tests_passed(self):
+    def passed_by_target(self) -> dict[str, bool]:
+        """Whether all of the test results for each target have passed, keyed by target."""
+        passed: dict[str, bool] = {}
+        for res in self.results:
+            passed[res.target] = passed.get(res.target, True) and res.passed
+        return passed
+
+    @property
+    def all_tests_passed(self) -> bool:
         """Simple pass/fail if all of the test results have passed."""
-        return np.all([res.passed for res in self.results])
+        return all(res.passed for res in self.results)
 
     def run(self) -> None:
         """Run all tests and write a verification report. See `results_df` property or
@@ -206,9 +225,9 @@ class Verifier:
         description = "Test that files in _metadata match the data files on disk."
         self.print_if_verbose(f"\nStarting: {description}")
 
-        files_ds_files = self._relative_paths(self.files_ds.files)
-        metadata_ds_files = self._relative_paths(self.metadata_ds.files)
-        failed_files = list(set(files_ds_files).symmetric_difference(metadata_ds_files))
+        missing_files = self.metadata_ds_relative_paths - self.files_ds_relative_paths
+        extra_files = self.files_ds_relative_paths - self.metadata_ds_relative_paths
+        failed_files = list(missing_files) + list(extra_files)
         passed = len(failed_files) == 0
         self.results.append(
             Result(
@@ -467,8 +486,12 @@ class Verifier:
                     f"# User-supplied truth total rows: {self.args.truth_total_rows}\n",
                 ]
             )
-        # Write results
-        self.results_df.to_csv(self.args.output_file_path, mode="a", header=True, index=False)
+        # Write results. bad_files is stringified, as the CSV writer does not support list columns.
+        results_table = pa.Table.from_pylist(
+            [asdict(result) | {"bad_files": str(result.bad_files)} for result in self.results]
+        )
+        with self.args.output_file_path.open("ab") as fout:
+            pa_csv.write_csv(results_table, fout)
         self.print_if_verbose(f"\nVerifier results written to {self.args.output_file_path}")
 
     def print_if_verbose(self, message):
@@ -360,6 +360,17 @@ def test_map_small_sky_part_order1(tmp_path, small_sky_file0):
     assert (result == expected).all()
 
 
+def test_row_count_aggregator_widens():
+    """Row count aggregator should accumulate as int32, and widen to int64 before overflow."""
+    aggregator = mr._RowCountAggregator(0)
+    aggregator.add(SparseHistogram([11], [131], 0))
+    assert aggregator.full_histogram.dtype == np.int32
+
+    aggregator.add(SparseHistogram([11], [np.iinfo(np.int32).max], 0))
+    assert aggregator.full_histogram.dtype == np.int64
+    assert aggregator.full_histogram[11] == np.iinfo(np.int32).max + 131
+
+
 def test_split_pixels_bad_format(blank_data_file, tmp_path, capsys):
     """Test error behavior, e.g. when alignment file is missing."""
     alignment = np.full(12, None)
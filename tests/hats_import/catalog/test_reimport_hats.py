@@ -1,5 +1,4 @@
 import hats
-import pandas as pd
 import pyarrow.parquet as pq
 import pytest
 from hats import HealpixPixel, read_hats
@@ -11,52 +10,54 @@ from hats_import.catalog import ImportArguments
 from hats_import.catalog.file_readers import ParquetPyarrowReader
 
 
-def test_reimport_arguments(tmp_path, small_sky_object_catalog):
-    args = ImportArguments.reimport_from_hats(
-        small_sky_object_catalog, tmp_path, addl_hats_properties={"obs_regime": "Optical"}
-    )
+@pytest.fixture(scope="module")
+def loaded_small_sky(small_sky_object_catalog):
+    """The small_sky_object_catalog, and its leaf file paths, read once for this module."""
     catalog = hats.read_hats(small_sky_object_catalog)
     file_paths = [
         hats.io.pixel_catalog_file(catalog.catalog_base_dir, p) for p in catalog.get_healpix_pixels()
     ]
+    return catalog, file_paths
+
+
+def _assert_common_args(args, catalog, file_paths):
+    """Check the arguments that every reimport of small_sky_object_catalog should share."""
     assert args.catalog_type == catalog.catalog_info.catalog_type
     assert args.ra_column == catalog.catalog_info.ra_column
     assert args.dec_column == catalog.catalog_info.dec_column
     assert args.input_paths == file_paths
     assert isinstance(args.file_reader, ParquetPyarrowReader)
-    assert args.output_artifact_name == catalog.catalog_name
     assert args.expected_total_rows == catalog.catalog_info.total_rows
+    assert args.use_healpix_29
+    assert not args.add_healpix_29
+
+
+def test_reimport_arguments(tmp_path, small_sky_object_catalog, loaded_small_sky):
+    args = ImportArguments.reimport_from_hats(
+        small_sky_object_catalog, tmp_path, addl_hats_properties={"obs_regime": "Optical"}
+    )
+    catalog, file_paths = loaded_small_sky
+    _assert_common_args(args, catalog, file_paths)
+    assert args.output_artifact_name == catalog.catalog_name
     assert args.addl_hats_properties == catalog.catalog_info.extra_dict(by_alias=True) | {
         "hats_cols_default": catalog.catalog_info.default_columns,
         "hats_npix_suffix": catalog.catalog_info.npix_suffix,
         "obs_regime": "Optical",
     }
-    assert args.use_healpix_29
-    assert not args.add_healpix_29
 
 
-def test_reimport_arguments_constant(tmp_path, small_sky_object_catalog):
+def test_reimport_arguments_constant(tmp_path, small_sky_object_catalog, loaded_small_sky):
     args = ImportArguments.reimport_from_hats(small_sky_object_catalog, tmp_path, constant_healpix_order=6)
-    catalog = hats.read_hats(small_sky_object_catalog)
-    file_paths = [
-        hats.io.pixel_catalog_file(catalog.catalog_base_dir, p) for p in catalog.get_healpix_pixels()
-    ]
-    assert args.catalog_type == catalog.catalog_info.catalog_type
-    assert args.ra_column == catalog.catalog_info.ra_column
-    assert args.dec_column == catalog.catalog_info.dec_column
-    assert args.input_paths == file_paths
-    assert isinstance(args.file_reader, ParquetPyarrowReader)
+    catalog, file_paths = loaded_small_sky
+    _assert_common_args(args, catalog, file_paths)
     assert args.output_artifact_name == catalog.catalog_name
-    assert args.expected_total_rows == catalog.catalog_info.total_rows
     assert args.addl_hats_properties == catalog.catalog_info.extra_dict(by_alias=True) | {
         "hats_cols_default": catalog.catalog_info.default_columns,
         "hats_npix_suffix": catalog.catalog_info.npix_suffix,
     }
-    assert args.use_healpix_29
-    assert not args.add_healpix_29
 
 
-def test_reimport_arguments_extra_kwargs(tmp_path, small_sky_object_catalog):
+def test_reimport_arguments_extra_kwargs(tmp_path, small_sky_object_catalog, loaded_small_sky):
     output_name = "small_sky_higher_order"
     pixel_thresh = 100
     args = ImportArguments.reimport_from_hats(
@@ -66,24 +67,14 @@ def test_reimport_arguments_extra_kwargs(tmp_path, small_sky_object_catalog):
         output_artifact_name=output_name,
         highest_healpix_order=2,
     )
-    catalog = hats.read_hats(small_sky_object_catalog)
-    file_paths = [
-        hats.io.pixel_catalog_file(catalog.catalog_base_dir, p) for p in catalog.get_healpix_pixels()
-    ]
-    assert args.catalog_type == catalog.catalog_info.catalog_type
-    assert args.ra_column == catalog.catalog_info.ra_column
-    assert args.dec_column == catalog.catalog_info.dec_column
-    assert args.input_paths == file_paths
-    assert isinstance(args.file_reader, ParquetPyarrowReader)
+    catalog, file_paths = loaded_small_sky
+    _assert_common_args(args, catalog, file_paths)
     assert args.output_artifact_name == output_name
     assert args.pixel_threshold == pixel_thresh
-    assert args.expected_total_rows == catalog.catalog_info.total_rows
     assert args.addl_hats_properties == catalog.catalog_info.extra_dict(by_alias=True) | {
         "hats_cols_default": catalog.catalog_info.default_columns,
         "hats_npix_suffix": catalog.catalog_info.npix_suffix,
     }
-    assert args.use_healpix_29
-    assert not args.add_healpix_29
 
 
 def test_reimport_arguments_empty_dir(tmp_path):
@@ -97,11 +88,11 @@ def test_reimport_arguments_invalid_dir(wrong_files_and_rows_dir, tmp_path):
         ImportArguments.reimport_from_hats(wrong_files_and_rows_dir, tmp_path)
 
 
-def test_reimport_arguments_catalog_collection(test_data_dir, small_sky_object_catalog, tmp_path):
+def test_reimport_arguments_catalog_collection(test_data_dir, loaded_small_sky, tmp_path):
     wrong_input_path = test_data_dir / "small_sky_collection"
     args = ImportArguments.reimport_from_hats(wrong_input_path, tmp_path)
 
-    catalog = hats.read_hats(small_sky_object_catalog)
+    catalog, _ = loaded_small_sky
     assert len(args.input_paths) == len(catalog.get_healpix_pixels())
     assert args.catalog_type == catalog.catalog_info.catalog_type
     assert args.ra_column == catalog.catalog_info.ra_column
@@ -146,6 +137,7 @@ def test_reimport_arguments_association_wrong_catalog_type(small_sky_object_cata
 def test_run_reimport(
     dask_client,
     small_sky_object_catalog,
+    loaded_small_sky,
     tmp_path,
 ):
     output_name = "small_sky_higher_order"
@@ -162,7 +154,7 @@ def test_run_reimport(
 
     runner.run(args, dask_client)
 
-    old_cat = read_hats(small_sky_object_catalog)
+    old_cat, _ = loaded_small_sky
 
     # Check that the catalog metadata file exists
     catalog = read_hats(args.catalog_path)
@@ -190,13 +182,13 @@ def test_run_reimport(
     schema = pq.read_metadata(args.catalog_path / "dataset" / "_metadata").schema.to_arrow_schema()
     assert schema.equals(expected_parquet_schema)
     output_file = args.catalog_path / "dataset" / "Norder=1" / "Dir=0" / "Npix=44.parquet"
-    schema = pq.read_metadata(output_file).schema.to_arrow_schema()
-    assert schema.equals(expected_parquet_schema)
+    leaf_schema = pq.ParquetFile(output_file, pre_buffer=True).schema_arrow
+    assert leaf_schema.equals(expected_parquet_schema)
 
     # Check that, when re-loaded as a pandas dataframe, the appropriate numeric types are used.
-    data_frame = pd.read_parquet(output_file, engine="pyarrow")
+    # The pandas conversion only needs the schema, so use an empty table rather than decoding rows.
     expected_dtypes = expected_parquet_schema.empty_table().to_pandas().dtypes
-    assert data_frame.dtypes.equals(expected_dtypes)
+    assert leaf_schema.empty_table().to_pandas().dtypes.equals(expected_dtypes)
 
     # Check that the fits files exist
     pointmap_file = paths.get_point_map_file_pointer(args.catalog_path)
@@ -242,13 +234,12 @@ def test_run_reimport_association(dask_client, small_sky_object_source_associati
     schema = pq.read_metadata(args.catalog_path / "dataset" / "_metadata").schema.to_arrow_schema()
     assert schema.equals(expected_parquet_schema)
     output_file = args.catalog_path / "dataset" / "Norder=0" / "Dir=0" / "Npix=11.parquet"
-    schema = pq.read_metadata(output_file).schema.to_arrow_schema()
-    assert schema.equals(expected_parquet_schema)
+    leaf_schema = pq.ParquetFile(output_file, pre_buffer=True).schema_arrow
+    assert leaf_schema.equals(expected_parquet_schema)
 
     # Check that, when re-loaded as a pandas dataframe, the appropriate numeric types are used.
-    data_frame = pd.read_parquet(output_file, engine="pyarrow")
     expected_dtypes = expected_parquet_schema.empty_table().to_pandas().dtypes
-    assert data_frame.dtypes.equals(expected_dtypes)
+    assert leaf_schema.empty_table().to_pandas().dtypes.equals(expected_dtypes)
 
     # Check that the fits files do not exist
     pointmap_file = paths.get_point_map_file_pointer(args.catalog_path)
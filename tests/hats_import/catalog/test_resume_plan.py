@@ -105,7 +105,9 @@ def test_read_write_histogram(tmp_path):
     remaining_keys = plan.get_remaining_map_keys()
     assert len(remaining_keys) == 0
     result = plan.read_histogram(0)
-    npt.assert_array_equal(result, histogram.to_array())
+    expected = histogram.to_array()
+    assert result.dtype == expected.dtype and result.shape == expected.shape
+    assert result.tobytes() == expected.tobytes()
 
 
 def test_get_alignment_file(tmp_path):
@@ -122,6 +124,20 @@ def test_get_alignment_file(tmp_path):
         plan.get_alignment_file(raw_histogram, -1, 0, 0, 1_000, True, 130)
 
 
+def test_fill_empty_alignment():
+    """Unmapped (None) alignment entries are filled with [-1, -1, 0]."""
+    alignment = np.empty(3, dtype=object)
+    alignment[1] = (0, 1, 45)
+    dense_alignment = ResumePlan._fill_empty_alignment(alignment)
+    npt.assert_array_equal(dense_alignment, [[-1, -1, 0], [0, 1, 45], [-1, -1, 0]])
+    assert dense_alignment.dtype == np.int64
+
+    ## Fully-mapped alignments are already dense.
+    dense_alignment = ResumePlan._fill_empty_alignment(np.array([[0, 0, 3], [0, 1, 45]], dtype=object))
+    npt.assert_array_equal(dense_alignment, [[0, 0, 3], [0, 1, 45]])
+    assert dense_alignment.dtype == np.int64
+
+
 def never_fails():
     """Method never fails, but never marks intermediate success file."""
     return
@@ -556,6 +556,7 @@ def assert_stage_level_files_exist(base_intermediate_dir):
     # `small_sky_object_catalog` at order 0.
     expected_contents = [
         "alignment.pickle",
+        "input_paths.blake2b",  # digest of original input paths, for quick comparison
         "input_paths.txt",  # original input paths for subsequent comparison
         "mapping_done",  # stage-level done file
         "order_0",  # all intermediate parquet files
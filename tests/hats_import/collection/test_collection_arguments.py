@@ -62,42 +62,20 @@ def test_subcatalog_table_properties(tmp_path, blank_data_dir):
 
 
 def test_subcatalog_wrong_order(tmp_path, blank_data_dir):
-    with pytest.raises(ValueError, match="add catalog arguments"):
-        CollectionArguments(
-            output_artifact_name="good_name",
-            output_path=tmp_path,
-            progress_bar=False,
-            addl_hats_properties={"hats_cols_default": "id, mjd", "obs_regime": "Optical"},
-        ).add_margin(margin_threshold=5.0).add_margin(margin_threshold=15.0)
-
-    with pytest.raises(ValueError, match="add catalog arguments"):
-        CollectionArguments(
-            output_artifact_name="good_name",
-            output_path=tmp_path,
-            progress_bar=False,
-            addl_hats_properties={"hats_cols_default": "id, mjd", "obs_regime": "Optical"},
-        ).add_index(indexing_column="id")
-
-    with pytest.raises(ValueError, match="exactly once"):
-        CollectionArguments(
-            output_artifact_name="good_name",
-            output_path=tmp_path,
-            progress_bar=False,
-            addl_hats_properties={"hats_cols_default": "id, mjd", "obs_regime": "Optical"},
-        ).catalog(
-            input_path=blank_data_dir,
-            file_reader="csv",
-        ).catalog(
-            input_path=blank_data_dir,
-            file_reader="csv",
-        )
-
+    ## None of the failing calls modify the arguments before raising, so we can share one instance.
     args = CollectionArguments(
         output_artifact_name="good_name",
         output_path=tmp_path,
         progress_bar=False,
         addl_hats_properties={"hats_cols_default": "id, mjd", "obs_regime": "Optical"},
     )
+
+    with pytest.raises(ValueError, match="add catalog arguments"):
+        args.add_margin(margin_threshold=5.0).add_margin(margin_threshold=15.0)
+
+    with pytest.raises(ValueError, match="add catalog arguments"):
+        args.add_index(indexing_column="id")
+
     with pytest.raises(ValueError, match="add catalog arguments"):
         args.get_catalog_args()
     with pytest.raises(ValueError, match="add catalog arguments"):
@@ -107,6 +85,16 @@ def test_subcatalog_wrong_order(tmp_path, blank_data_dir):
     with pytest.raises(ValueError, match="add catalog arguments"):
         args.to_collection_properties()
 
+    ## This one sets the catalog arguments, so it goes last.
+    with pytest.raises(ValueError, match="exactly once"):
+        args.catalog(
+            input_path=blank_data_dir,
+            file_reader="csv",
+        ).catalog(
+            input_path=blank_data_dir,
+            file_reader="csv",
+        )
+
 
 @pytest.mark.skipif((3, 11) <= sys.version_info < (3, 12), reason="dask expr regression with python 3.11")
 def test_subcatalog_existing_catalog(tmp_path, small_sky_object_catalog):
@@ -142,64 +130,40 @@ def test_subcatalog_existing_catalog(tmp_path, small_sky_object_catalog):
 
 @pytest.mark.skipif((3, 11) <= sys.version_info < (3, 12), reason="dask expr regression with python 3.11")
 def test_index_bad_values(tmp_path, small_sky_object_catalog):
+    ## The failed add_index does not modify the arguments, so the catalog is only loaded once.
+    args = CollectionArguments(
+        output_artifact_name="small_sky_collection",
+        output_path=tmp_path,
+        progress_bar=False,
+        tmp_dir=tmp_path,
+    ).catalog(
+        catalog_path=small_sky_object_catalog,
+    )
+
     with pytest.raises(ValueError, match="indexing_column is required"):
-        (
-            CollectionArguments(
-                output_artifact_name="small_sky_collection",
-                output_path=tmp_path,
-                progress_bar=False,
-                tmp_dir=tmp_path,
-            )
-            .catalog(
-                catalog_path=small_sky_object_catalog,
-            )
-            .add_index()
-        )
+        args.add_index()
 
-    args = (
-        CollectionArguments(
-            output_artifact_name="small_sky_collection",
-            output_path=tmp_path,
-            progress_bar=False,
-            tmp_dir=tmp_path,
-        )
-        .catalog(
-            catalog_path=small_sky_object_catalog,
-        )
-        .add_index(indexing_column="id", extra_columns=["not", "there"])
-    )
+    args.add_index(indexing_column="id", extra_columns=["not", "there"])
 
     with pytest.raises(ValueError, match="not in input catalog"):
         args.get_index_args()
 
 
 def test_margin_bad_values(tmp_path, small_sky_object_catalog):
+    ## The failed add_margin does not modify the arguments, so the catalog is only loaded once.
+    args = CollectionArguments(
+        output_artifact_name="small_sky_collection",
+        output_path=tmp_path,
+        progress_bar=False,
+        tmp_dir=tmp_path,
+    ).catalog(
+        catalog_path=small_sky_object_catalog,
+    )
+
     with pytest.raises(ValueError, match="threshold required"):
-        (
-            CollectionArguments(
-                output_artifact_name="small_sky_collection",
-                output_path=tmp_path,
-                progress_bar=False,
-                tmp_dir=tmp_path,
-            )
-            .catalog(
-                catalog_path=small_sky_object_catalog,
-            )
-            .add_margin()
-        )
+        args.add_margin()
 
-    args = (
-        CollectionArguments(
-            output_artifact_name="small_sky_collection",
-            output_path=tmp_path,
-            progress_bar=False,
-            tmp_dir=tmp_path,
-        )
-        .catalog(
-            catalog_path=small_sky_object_catalog,
-        )
-        .add_margin(margin_threshold=1_000_000)
-    )
+    args.add_margin(margin_threshold=1_000_000)
 
     with pytest.raises(ValueError, match="higher order"):
         args.get_margin_args()
@@ -56,7 +56,7 @@ def pytest_collection_modifyitems(items):
 TEST_DIR = os.path.dirname(__file__)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_data_dir():
     return Path(TEST_DIR).parent / "data"
 
@@ -71,7 +71,7 @@ def small_sky_single_file(test_data_dir):
     return test_data_dir / "small_sky" / "catalog.csv"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def small_sky_object_catalog(test_data_dir):
     return test_data_dir / "small_sky_object_catalog"
 
@@ -363,11 +363,11 @@ def assert_parquet_file_index():
     return assert_parquet_file_index
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def bad_schemas_dir(test_data_dir):
     return test_data_dir / "bad_schemas"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def wrong_files_and_rows_dir(test_data_dir):
     return test_data_dir / "wrong_files_and_rows"
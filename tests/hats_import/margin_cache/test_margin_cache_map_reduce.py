@@ -6,7 +6,7 @@ import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 import pytest
-from hats import pixel_math
+from hats import pixel_math, read_hats
 from hats.io import paths
 from hats.pixel_math.healpix_pixel import HealpixPixel
 
@@ -72,7 +72,37 @@ def test_to_pixel_shard_polar(tmp_path, polar_data_shard_df):
     validate_result_dataframe(path, 360)
 
 
-def test_map_pixel_shards_error(tmp_path, capsys):
+def test_partition_row_filters():
+    """Row filters should match a merge of row margin pixels against the margin pairs."""
+    rng = np.random.default_rng(seed=53)
+    margin_pixel_list = rng.integers(0, 40, size=500)
+    margin_pairs = pd.DataFrame(
+        {
+            "margin_pixel": rng.integers(0, 50, size=60),
+            "partition_order": rng.integers(0, 2, size=60),
+            "partition_pixel": rng.integers(0, 3, size=60),
+        }
+    )
+    ## Include a repeated pair, which should not repeat row indexes.
+    margin_pairs = pd.concat([margin_pairs, margin_pairs.iloc[:5]], ignore_index=True)
+
+    result = margin_cache_map_reduce._partition_row_filters(margin_pixel_list, margin_pairs)
+
+    expected = pd.DataFrame(
+        {"margin_pixel": margin_pixel_list, "filter_value": np.arange(0, len(margin_pixel_list))}
+    ).merge(margin_pairs, on="margin_pixel")
+    expected = {
+        key: np.unique(group["filter_value"])
+        for key, group in expected.groupby(["partition_order", "partition_pixel"])
+    }
+    assert result.keys() == expected.keys()
+    for key, row_filter in expected.items():
+        np.testing.assert_array_equal(result[key], row_filter)
+
+    assert not margin_cache_map_reduce._partition_row_filters(np.array([45, 46]), margin_pairs.iloc[0:0])
+
+
+def test_map_pixel_shards_error(tmp_path, test_data_dir, capsys):
     """Test error behavior on reduce stage. e.g. by not creating the original
     catalog parquet files."""
     with pytest.raises(FileNotFoundError):
@@ -80,16 +110,17 @@ def test_map_pixel_shards_error(tmp_path, capsys):
             paths.pixel_catalog_file(tmp_path, HealpixPixel(1, 0)),
             mapping_key="1_21",
             source_pixel=HealpixPixel(1, 0),
-            original_catalog_metadata="",
-            margin_pair_file="",
+            schema=None,
+            margin_pair_file=test_data_dir / "margin_pairs" / "small_sky_source_pairs.parquet",
             output_path=tmp_path,
-            margin_order=4,
+            margin_order=3,
             healpix_column="_healpix_29",
             healpix_order=29,
         )
 
     captured = capsys.readouterr()
-    assert "Parquet file does not exist" in captured.out
+    assert "Failed MAPPING stage for pixel: 1_21" in captured.out
+    assert "Npix=0.parquet" in captured.out
 
 
 @pytest.mark.timeout(15)
@@ -101,8 +132,8 @@ def test_map_pixel_shards_coarse(tmp_path, test_data_dir, small_sky_source_catal
         paths.pixel_catalog_file(small_sky_source_catalog, HealpixPixel(1, 47)),
         source_pixel=HealpixPixel(1, 47),
         mapping_key="1_47",
-        original_catalog_metadata=small_sky_source_catalog / "dataset" / "_common_metadata",
-        margin_pair_file=test_data_dir / "margin_pairs" / "small_sky_source_pairs.csv",
+        schema=read_hats(small_sky_source_catalog).schema,
+        margin_pair_file=test_data_dir / "margin_pairs" / "small_sky_source_pairs.parquet",
         output_path=intermediate_dir,
         margin_order=3,
         healpix_column="_healpix_29",
@@ -201,7 +232,7 @@ def test_reduce_margin_shards(tmp_path):
     assert not os.path.exists(shard_dir)
 
 
-def test_map_pixel_shards_no_match(tmp_path, test_data_dir, small_sky_source_catalog):
+def test_map_pixel_shards_no_match(tmp_path, small_sky_source_catalog):
     """When no row falls into any margin pixel, the full-schema read is skipped.
 
     Regression guard for issue #685: the early-exit branch must short-circuit
@@ -210,23 +241,80 @@ def test_map_pixel_shards_no_match(tmp_path, test_data_dir, small_sky_source_cat
     intermediate_dir = tmp_path / "intermediate"
     os.makedirs(intermediate_dir / "mapping")
 
+    ## A single candidate margin pixel, in the corner of the source pixel, where there are no rows.
+    margin_pair_file = tmp_path / "margin_pairs.parquet"
+    pd.DataFrame({"partition_order": [1], "partition_pixel": [46], "margin_pixel": [47 * 4**9]}).to_parquet(
+        margin_pair_file, index=False
+    )
+
+    partition_file = paths.pixel_catalog_file(small_sky_source_catalog, HealpixPixel(1, 47))
     with patch.object(pq, "read_table", wraps=pq.read_table) as read_table_spy:
         margin_cache_map_reduce.map_pixel_shards(
-            paths.pixel_catalog_file(small_sky_source_catalog, HealpixPixel(1, 47)),
+            partition_file,
             source_pixel=HealpixPixel(1, 47),
             mapping_key="1_47",
-            original_catalog_metadata=small_sky_source_catalog / "dataset" / "_common_metadata",
-            margin_pair_file=test_data_dir / "margin_pairs" / "small_sky_source_pairs.csv",
+            schema=read_hats(small_sky_source_catalog).schema,
+            margin_pair_file=margin_pair_file,
             output_path=intermediate_dir,
-            margin_order=1,
+            margin_order=10,
             healpix_column="_healpix_29",
             healpix_order=29,
         )
 
-    # Exactly one read happened, and it asked for only the healpix column.
-    assert read_table_spy.call_count == 1
-    assert read_table_spy.call_args.kwargs.get("columns") == ["_healpix_29"]
+    # Exactly one read of the source data happened, and it asked for only the healpix column.
+    partition_reads = [call for call in read_table_spy.call_args_list if call.args[0] == partition_file.path]
+    assert len(partition_reads) == 1
+    assert partition_reads[0].kwargs.get("columns") == ["_healpix_29"]
 
     # And the observable behavior: marker written, no shards.
     assert os.path.exists(intermediate_dir / "mapping" / "1_47_done")
     assert not any(p.name.startswith("order_") for p in intermediate_dir.iterdir())
+
+
+def test_map_pixel_shards_uses_schema(tmp_path, test_data_dir, small_sky_source_catalog):
+    """Source data is read with the schema passed in by the caller."""
+    intermediate_dir = tmp_path / "intermediate"
+    os.makedirs(intermediate_dir / "mapping")
+    schema = read_hats(small_sky_source_catalog).schema
+
+    partition_file = paths.pixel_catalog_file(small_sky_source_catalog, HealpixPixel(1, 47))
+    with patch.object(pq, "read_table", wraps=pq.read_table) as read_table_spy:
+        margin_cache_map_reduce.map_pixel_shards(
+            partition_file,
+            source_pixel=HealpixPixel(1, 47),
+            mapping_key="1_47",
+            schema=schema,
+            margin_pair_file=test_data_dir / "margin_pairs" / "small_sky_source_pairs.parquet",
+            output_path=intermediate_dir,
+            margin_order=3,
+            healpix_column="_healpix_29",
+            healpix_order=29,
+        )
+
+    partition_reads = [call for call in read_table_spy.call_args_list if call.args[0] == partition_file.path]
+    assert len(partition_reads) == 2
+    assert all(call.kwargs["schema"] is schema for call in partition_reads)
+
+
+def test_map_pixel_shards_no_margin_pairs(tmp_path, test_data_dir, small_sky_source_catalog):
+    """When no margin pixels fall inside the source pixel, the source data isn't read at all."""
+    intermediate_dir = tmp_path / "intermediate"
+    os.makedirs(intermediate_dir / "mapping")
+
+    partition_file = paths.pixel_catalog_file(small_sky_source_catalog, HealpixPixel(1, 47))
+    with patch.object(pq, "read_table", wraps=pq.read_table) as read_table_spy:
+        margin_cache_map_reduce.map_pixel_shards(
+            partition_file,
+            source_pixel=HealpixPixel(1, 47),
+            mapping_key="1_47",
+            schema=read_hats(small_sky_source_catalog).schema,
+            margin_pair_file=test_data_dir / "margin_pairs" / "small_sky_source_pairs.parquet",
+            output_path=intermediate_dir,
+            margin_order=1,
+            healpix_column="_healpix_29",
+            healpix_order=29,
+        )
+
+    assert not any(call.args[0] == partition_file.path for call in read_table_spy.call_args_list)
+    assert os.path.exists(intermediate_dir / "mapping" / "1_47_done")
+    assert not any(p.name.startswith("order_") for p in intermediate_dir.iterdir())
@@ -1,5 +1,6 @@
 import numpy as np
 import numpy.testing as npt
+import pyarrow.parquet as pq
 import pytest
 from hats import read_hats
 
@@ -118,6 +119,22 @@ def test_mapping_total(small_sky_margin_args):
     assert mapping_total == 54
 
 
+def test_margin_pair_file_row_groups(small_sky_margin_args, monkeypatch):
+    """Margin pairs are written in row groups with non-overlapping margin pixel ranges."""
+    monkeypatch.setattr(MarginCachePlan, "MARGIN_PAIR_ROW_GROUP_SIZE", 50)
+    plan = MarginCachePlan(small_sky_margin_args)
+
+    metadata = pq.ParquetFile(plan.margin_pair_file.path).metadata
+    column_index = metadata.schema.names.index("margin_pixel")
+    row_groups = [metadata.row_group(index) for index in range(metadata.num_row_groups)]
+    assert len(row_groups) > 1
+    assert all(row_group.num_rows <= 50 for row_group in row_groups)
+
+    statistics = [row_group.column(column_index).statistics for row_group in row_groups]
+    for previous, following in zip(statistics[:-1], statistics[1:]):
+        assert previous.max <= following.min
+
+
 def test_partition_margin_pixel_pairs(small_sky_source_catalog):
     """Ensure partition_margin_pixel_pairs can generate main partition pixels."""
     source_catalog = read_hats(small_sky_source_catalog)
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import numpy.testing as npt
 import pytest
+from hats.pixel_math.healpix_pixel import HealpixPixel
 
 from hats_import.pipeline_resume_plan import PipelineResumePlan, get_formatted_stage_name
 
@@ -151,6 +152,17 @@ def test_formatted_stage_name_with_pipeline():
     assert formatted == "Shorter pipeline: Very long stage name"
 
 
+def test_print_progress_disabled(tmp_path):
+    """With progress bars disabled, iterables pass through, and step counters still work."""
+    plan = PipelineResumePlan(tmp_path=tmp_path, progress_bar=False)
+    items = [1, 2, 3]
+    assert plan.print_progress(items, stage_name="counting") is items
+
+    with plan.print_progress(total=2, stage_name="stepping") as step_progress:
+        step_progress.update(1)
+        step_progress.update(1)
+
+
 def test_check_original_input_paths(tmp_path, mixed_schema_csv_dir):
     plan = PipelineResumePlan(tmp_path=tmp_path, progress_bar=False, resume=False)
 
@@ -164,9 +176,33 @@ def test_check_original_input_paths(tmp_path, mixed_schema_csv_dir):
     round_trip_files = plan.check_original_input_paths(checked_files)
 
     npt.assert_array_equal(checked_files, round_trip_files)
+    assert (tmp_path / "input_paths.blake2b").exists()
+
+    ## Without the digest file, we fall back to comparing the full file list.
+    (tmp_path / "input_paths.blake2b").unlink()
+    plan.check_original_input_paths(list(reversed(checked_files)))
+    assert (tmp_path / "input_paths.blake2b").exists()
+
+    with pytest.raises(ValueError, match="Different file set"):
+        plan.check_original_input_paths(input_file_list[:1])
 
 
 def test_read_markers(test_data_dir):
     plan = PipelineResumePlan(tmp_path=test_data_dir / "markers", progress_bar=False)
     markers = plan.read_markers("mapping")
     assert markers == {"map_001": ["45"], "map_002": ["zippy"]}
+
+
+def test_read_done_keys(tmp_path):
+    plan = PipelineResumePlan(tmp_path=tmp_path, progress_bar=False)
+    assert plan.read_done_keys("reducing") == []
+
+    (tmp_path / "reducing").mkdir()
+    PipelineResumePlan.touch_key_done_file(tmp_path, "reducing", "0_11")
+    (tmp_path / "reducing" / "not_a_marker.txt").touch()
+    assert plan.read_done_keys("reducing") == ["0_11"]
+
+    ## Newly-touched done files are found, even after a prior listing.
+    PipelineResumePlan.touch_key_done_file(tmp_path, "reducing", "1_44")
+    assert set(plan.read_done_keys("reducing")) == {"0_11", "1_44"}
+    assert set(plan.read_done_pixels("reducing")) == {HealpixPixel(0, 11), HealpixPixel(1, 44)}
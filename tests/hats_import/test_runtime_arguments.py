@@ -113,23 +113,23 @@ def test_dask_args(tmp_path):
         )
 
 
-def test_check_healpix_order_range():
+@pytest.mark.parametrize(
+    "order,kwargs,exception,match",
+    [
+        (5, {}, None, None),
+        (5, {"lower_bound": 0, "upper_bound": 19}, None, None),
+        (5, {"lower_bound": -1}, ValueError, "positive"),
+        (5, {"upper_bound": 30}, ValueError, "29"),
+        (-1, {}, ValueError, "order_field"),
+        (30, {}, ValueError, "order_field"),
+        ("two", {}, TypeError, "not supported"),
+        (5, {"upper_bound": "ten"}, TypeError, "not supported"),
+    ],
+)
+def test_check_healpix_order_range(order, kwargs, exception, match):
     """Test method check_healpix_order_range"""
-    check_healpix_order_range(5, "order_field")
-    check_healpix_order_range(5, "order_field", lower_bound=0, upper_bound=19)
-
-    with pytest.raises(ValueError, match="positive"):
-        check_healpix_order_range(5, "order_field", lower_bound=-1)
-
-    with pytest.raises(ValueError, match="29"):
-        check_healpix_order_range(5, "order_field", upper_bound=30)
-
-    with pytest.raises(ValueError, match="order_field"):
-        check_healpix_order_range(-1, "order_field")
-    with pytest.raises(ValueError, match="order_field"):
-        check_healpix_order_range(30, "order_field")
-
-    with pytest.raises(TypeError, match="not supported"):
-        check_healpix_order_range("two", "order_field")
-    with pytest.raises(TypeError, match="not supported"):
-        check_healpix_order_range(5, "order_field", upper_bound="ten")
+    if exception is None:
+        check_healpix_order_range(order, "order_field", **kwargs)
+    else:
+        with pytest.raises(exception, match=match):
+            check_healpix_order_range(order, "order_field", **kwargs)
@@ -0,0 +1,57 @@
+import pytest
+
+import hats_import.verification.run_verification as runner
+from hats_import.verification.arguments import VerificationArguments
+
+
+def _make_verifier(input_catalog_path, output_path, truth_schema=None):
+    args = VerificationArguments(
+        input_catalog_path=input_catalog_path,
+        output_path=output_path,
+        truth_total_rows=131,
+        truth_schema=truth_schema,
+        verbose=False,
+    )
+    return runner.Verifier.from_args(args)
+
+
+@pytest.fixture(scope="module")
+def _valid_verifier(small_sky_object_catalog, tmp_path_factory):
+    ## The catalog's own _common_metadata is also its truth schema, so this one
+    ## Verifier serves the file set, row count, and schema tests alike.
+    return _make_verifier(
+        small_sky_object_catalog,
+        tmp_path_factory.mktemp("valid_verifier"),
+        truth_schema=small_sky_object_catalog / "dataset/_common_metadata",
+    )
+
+
+@pytest.fixture(scope="module")
+def _invalid_verifier(wrong_files_and_rows_dir, tmp_path_factory):
+    return _make_verifier(wrong_files_and_rows_dir, tmp_path_factory.mktemp("invalid_verifier"))
+
+
+@pytest.fixture
+def valid_verifier(_valid_verifier):
+    """Verifier over the good small_sky_object_catalog, shared per module, with results reset per test."""
+    _valid_verifier.results = []
+    return _valid_verifier
+
+
+@pytest.fixture
+def invalid_verifier(_invalid_verifier):
+    """Verifier over the wrong_files_and_rows catalog, shared per module, with results reset per test."""
+    _invalid_verifier.results = []
+    return _invalid_verifier
+
+
+@pytest.fixture(scope="module")
+def invalid_schema_verifier(bad_schemas_dir, tmp_path_factory):
+    """Verifier over the bad_schemas catalog, using its import truth schema."""
+    args = VerificationArguments(
+        input_catalog_path=bad_schemas_dir,
+        output_path=tmp_path_factory.mktemp("invalid_schema_verifier"),
+        truth_schema=bad_schemas_dir / "dataset/_common_metadata.import_truth",
+        verbose=False,
+    )
+    return runner.Verifier.from_args(args)
@@ -1,12 +1,27 @@
+import copy
+import dataclasses
 import logging
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
+from pyarrow import csv as pa_csv
 
 import hats_import.verification.run_verification as runner
 from hats_import.verification.arguments import VerificationArguments
 
 
+def _bad_file_names(bad_files):
+    """File names (without directories) across a column of `bad_files` lists."""
+    return bad_files.explode().dropna().str.rsplit("/", n=1).str[-1]
+
+
+def _same_set(left, right):
+    """Whether two collections of strings hold the same values, compared as sorted indexes."""
+    return pd.Index(sorted(left)).equals(pd.Index(sorted(right)))
+
+
 def test_bad_args():
     """Runner should fail with empty or mis-typed arguments"""
     with pytest.raises(TypeError, match="VerificationArguments"):
@@ -17,64 +32,67 @@ def test_bad_args():
         runner.run(args)
 
 
+def _read_report(report_path):
+    """Read a verification report with the pyarrow CSV reader, skipping the provenance comment lines."""
+    lines = [line for line in report_path.read_bytes().splitlines(keepends=True) if not line.startswith(b"#")]
+    return pa_csv.read_csv(pa.py_buffer(b"".join(lines))).to_pandas()
+
+
+def _assert_report_matches(report_path, verifier):
+    """The written report should hold the same results as `verifier.results_df`."""
+    result_cols = ["passed", "test", "target"]
+    written_results = _read_report(report_path)
+    expected_results = verifier.results_df
+    assert np.array_equal(
+        written_results[result_cols].to_numpy(), expected_results[result_cols].to_numpy()
+    ), "report failed"
+    written_times = pd.to_datetime(written_results["datetime"], cache=True)
+    expected_times = pd.to_datetime(expected_results["datetime"], cache=True)
+    assert written_times.equals(expected_times), "report datetimes failed"
+
+
 def test_runner(small_sky_object_catalog, wrong_files_and_rows_dir, tmp_path):
     """Runner should execute all tests and write a report to file."""
-    result_cols = ["datetime", "passed", "test", "target"]
-
     args = VerificationArguments(
         input_catalog_path=small_sky_object_catalog, output_path=tmp_path, verbose=False, write_mode="w"
     )
     verifier = runner.run(args)
     assert verifier.all_tests_passed, "good catalog failed"
-    written_results = pd.read_csv(args.output_path / args.output_filename, comment="#")
-    assert written_results[result_cols].equals(verifier.results_df[result_cols]), "report failed"
+    _assert_report_matches(args.output_file_path, verifier)
 
     args = VerificationArguments(
         input_catalog_path=wrong_files_and_rows_dir, output_path=tmp_path, verbose=False, write_mode="w"
     )
     verifier = runner.run(args)
     assert not verifier.all_tests_passed, "bad catalog passed"
-    written_results = pd.read_csv(args.output_path / args.output_filename, comment="#")
-    assert written_results[result_cols].equals(verifier.results_df[result_cols]), "report failed"
+    _assert_report_matches(args.output_file_path, verifier)
 
 
-def test_test_file_sets(small_sky_object_catalog, wrong_files_and_rows_dir, tmp_path):
+@pytest.mark.parametrize(
+    "verifier_fixture,should_pass,expected_bad_file_names",
+    [
+        ("valid_verifier", True, set()),
+        ("invalid_verifier", False, {"Npix=11.extra_file.parquet", "Npix=11.missing_file.parquet"}),
+    ],
+)
+def test_test_file_sets(request, verifier_fixture, should_pass, expected_bad_file_names):
     """File set tests should fail if files listed in _metadata don't match the actual data files."""
-    args = VerificationArguments(
-        input_catalog_path=small_sky_object_catalog, output_path=tmp_path, verbose=False
-    )
-    verifier = runner.Verifier.from_args(args)
+    verifier = request.getfixturevalue(verifier_fixture)
     passed = verifier.test_file_sets()
-    assert passed, "good catalog failed"
+    assert passed == should_pass, "wrong test result"
 
-    args = VerificationArguments(
-        input_catalog_path=wrong_files_and_rows_dir, output_path=tmp_path, verbose=False
-    )
-    verifier = runner.Verifier.from_args(args)
-    passed = verifier.test_file_sets()
-    assert not passed, "bad catalog passed"
-    expected_bad_file_names = {"Npix=11.extra_file.parquet", "Npix=11.missing_file.parquet"}
-    actual_bad_file_names = {
-        file_name.split("/")[-1] for file_name in verifier.results_df.bad_files.squeeze()
-    }
-    assert expected_bad_file_names == actual_bad_file_names, "bad_files failed"
+    actual_bad_file_names = _bad_file_names(verifier.results_df.bad_files)
+    assert _same_set(expected_bad_file_names, actual_bad_file_names), "bad_files failed"
 
 
-def test_test_is_valid_catalog(small_sky_object_catalog, wrong_files_and_rows_dir, tmp_path):
+@pytest.mark.parametrize(
+    "verifier_fixture,should_pass", [("valid_verifier", True), ("invalid_verifier", False)]
+)
+def test_test_is_valid_catalog(request, verifier_fixture, should_pass):
     """`hats.is_valid_catalog` should pass for good catalogs, fail for catalogs without ancillary files."""
-    args = VerificationArguments(
-        input_catalog_path=small_sky_object_catalog, output_path=tmp_path, verbose=False
-    )
-    verifier = runner.Verifier.from_args(args)
-    passed = verifier.test_is_valid_catalog()
-    assert passed, "good catalog failed"
-
-    args = VerificationArguments(
-        input_catalog_path=wrong_files_and_rows_dir, output_path=tmp_path, verbose=False
-    )
-    verifier = runner.Verifier.from_args(args)
+    verifier = request.getfixturevalue(verifier_fixture)
     passed = verifier.test_is_valid_catalog()
-    assert not passed, "bad catalog passed"
+    assert passed == should_pass, "wrong test result"
 
 
 def test_test_is_valid_collection(test_data_dir, tmp_path, caplog, capsys):
@@ -94,64 +112,59 @@ def test_test_is_valid_collection(test_data_dir, tmp_path, caplog, capsys):
     assert "Result: PASSED" in captured_stdout
 
 
-def test_test_num_rows(small_sky_object_catalog, wrong_files_and_rows_dir, tmp_path):
+@pytest.mark.parametrize(
+    "verifier_fixture,should_pass,expected_bad_file_names",
+    [
+        ("valid_verifier", True, set()),
+        (
+            "invalid_verifier",
+            False,
+            {"Npix=11.extra_file.parquet", "Npix=11.extra_rows.parquet", "Npix=11.missing_file.parquet"},
+        ),
+    ],
+)
+def test_test_num_rows(request, verifier_fixture, should_pass, expected_bad_file_names):
     """Row count tests should pass if all row counts match, else fail."""
-    args = VerificationArguments(
-        input_catalog_path=small_sky_object_catalog, output_path=tmp_path, truth_total_rows=131, verbose=False
-    )
-    verifier = runner.Verifier.from_args(args)
-    verifier.test_num_rows()
-    assert verifier.all_tests_passed, "good catalog failed"
-
-    args = VerificationArguments(
-        input_catalog_path=wrong_files_and_rows_dir, output_path=tmp_path, truth_total_rows=131, verbose=False
-    )
-    verifier = runner.Verifier.from_args(args)
+    verifier = request.getfixturevalue(verifier_fixture)
     verifier.test_num_rows()
     results = verifier.results_df
-    all_failed = not results.passed.any()
-    assert all_failed, "bad catalog passed"
+    if should_pass:
+        assert results.passed.all(), "good catalog failed"
+    else:
+        assert not results.passed.any(), "bad catalog passed"
 
     targets = {"file footers vs catalog properties", "file footers vs _metadata", "file footers vs truth"}
-    assert targets == set(results.target), "wrong targets"
+    assert _same_set(targets, results.target), "wrong targets"
+
+    actual_bad_file_names = _bad_file_names(
+        results.loc[results.target == "file footers vs _metadata", "bad_files"]
+    )
+    assert _same_set(expected_bad_file_names, actual_bad_file_names), "wrong bad_files"
 
-    expected_bad_file_names = {
-        "Npix=11.extra_file.parquet",
-        "Npix=11.extra_rows.parquet",
-        "Npix=11.missing_file.parquet",
-    }
-    _result = results.loc[results.target == "file footers vs _metadata"].squeeze()
-    actual_bad_file_names = {file_name.split("/")[-1] for file_name in _result.bad_files}
-    assert expected_bad_file_names == actual_bad_file_names, "wrong bad_files"
 
+def _with_check_metadata(verifier, check_metadata):
+    """Copy of a shared `verifier` with empty results and the given `check_metadata` argument."""
+    args = copy.copy(verifier.args)
+    args.check_metadata = check_metadata
+    return dataclasses.replace(verifier, args=args, results=[])
 
-@pytest.mark.parametrize("check_metadata", [(False,), (True,)])
-def test_test_schemas(small_sky_object_catalog, bad_schemas_dir, tmp_path, check_metadata):
+
+def test_test_schemas(valid_verifier, invalid_schema_verifier):
     """Schema tests should pass if all column names, dtypes, and (optionally) metadata match, else fail."""
-    # Show that a good catalog passes
-    args = VerificationArguments(
-        input_catalog_path=small_sky_object_catalog,
-        output_path=tmp_path,
-        truth_schema=small_sky_object_catalog / "dataset/_common_metadata",
-        verbose=False,
-        check_metadata=check_metadata,
-    )
-    verifier = runner.Verifier.from_args(args)
-    verifier.test_schemas()
-    assert verifier.all_tests_passed, "good catalog failed"
+    for check_metadata in (False, True):
+        # Show that a good catalog passes
+        verifier = _with_check_metadata(valid_verifier, check_metadata)
+        verifier.test_schemas()
+        assert verifier.all_tests_passed, f"good catalog failed ({check_metadata=})"
+
+        # Show that bad schemas fail.
+        verifier = _with_check_metadata(invalid_schema_verifier, check_metadata)
+        verifier.test_schemas()
+        _assert_bad_schema_results(verifier, check_metadata)
 
-    # Show that bad schemas fail.
-    args = VerificationArguments(
-        input_catalog_path=bad_schemas_dir,
-        output_path=tmp_path,
-        truth_schema=bad_schemas_dir / "dataset/_common_metadata.import_truth",
-        verbose=False,
-        check_metadata=check_metadata,
-    )
-    verifier = runner.Verifier.from_args(args)
-    verifier.test_schemas()
-    results = verifier.results_df
 
+def _assert_bad_schema_results(verifier, check_metadata):
+    """Check the `test_schemas` results for the bad_schemas catalog."""
     # Expecting _common_metadata and some file footers to always fail
     # and _metadata to fail if check_metadata is true.
     expect_failed = ["_common_metadata vs truth", "file footers vs truth"]
@@ -160,13 +173,13 @@ def test_test_schemas(small_sky_object_catalog, bad_schemas_dir, tmp_path, check
         expect_failed = expect_failed + ["_metadata vs truth"]
     else:
         expect_passed = ["_metadata vs truth"]
-    assert set(expect_passed + expect_failed) == set(results.target), "wrong targets"
-    assert all(results.loc[results.target.isin(expect_passed)].passed), "good targets failed"
-    assert not any(results.loc[results.target.isin(expect_failed)].passed), "bad targets passed"
+    passed_by_target = verifier.passed_by_target
+    assert _same_set(expect_passed + expect_failed, passed_by_target), "wrong targets"
+    assert all(passed_by_target[target] for target in expect_passed), "good targets failed"
+    assert not any(passed_by_target[target] for target in expect_failed), "bad targets passed"
 
     # Expecting data files with wrong columns or dtypes to always fail
     # and files with wrong metadata to fail if check_metadata is true.
-    result = results.loc[results.target == "file footers vs truth"].squeeze()
     expected_bad_files = [
         "Npix=11.extra_column.parquet",
         "Npix=11.missing_column.parquet",
@@ -174,5 +187,8 @@ def test_test_schemas(small_sky_object_catalog, bad_schemas_dir, tmp_path, check
     ]
     if check_metadata:
         expected_bad_files = expected_bad_files + ["Npix=11.wrong_metadata.parquet"]
-    actual_bad_file_names = {file_name.split("/")[-1] for file_name in result.bad_files}
-    assert set(expected_bad_files) == set(actual_bad_file_names), "wrong bad_files"
+    results = verifier.results_df
+    actual_bad_file_names = _bad_file_names(
+        results.loc[results.target == "file footers vs truth", "bad_files"]
+    )
+    assert _same_set(expected_bad_files, actual_bad_file_names), "wrong bad_files"
@@ -17,13 +17,17 @@ def test_invalid_paths(tmp_path, small_sky_object_catalog):
         )
 
 
+@pytest.fixture(scope="module")
+def verif_tmp(tmp_path_factory):
+    return tmp_path_factory.mktemp("verif")
+
+
 @pytest.mark.timeout(5)
-def test_good_paths(tmp_path, small_sky_object_catalog):
+def test_good_paths(verif_tmp, small_sky_object_catalog):
     """Required arguments are provided, and paths are found.
 
     NB: This is currently the last test in alpha-order, and may require additional
-    time to teardown fixtures."""
-    tmp_path_str = str(tmp_path)
-    args = VerificationArguments(input_catalog_path=small_sky_object_catalog, output_path=tmp_path)
-    assert args.input_catalog_path == small_sky_object_catalog
-    assert str(args.output_path) == tmp_path_str
+    time to teardown session-scoped fixtures. The output directory is module-scoped
+    so that no per-test temporary directory is created and torn down here."""
+    args = VerificationArguments(input_catalog_path=small_sky_object_catalog, output_path=verif_tmp)
+    assert (args.input_catalog_path, args.output_path) == (small_sky_object_catalog, verif_tmp)